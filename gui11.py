@@ -1,17 +1,26 @@
 """GUI Aplikasi Pemantauan Gas Rumah Kaca Jakarta (CO₂ & CH₄) berbasis Open-Meteo API."""
 
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
-from tkcalendar import DateEntry
 
-plt.style.use('ggplot')
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+# matplotlib diimpor saat grafik pertama kali ditampilkan (lihat
+# _import_matplotlib) agar jendela utama tampil lebih cepat.
+plt = None
+FigureCanvasTkAgg = None
+mdates = None
 
 # =============================
 # Koordinat Wilayah Jakarta
@@ -24,39 +33,143 @@ wilayah_coords = {
     "Jakarta Utara": (-6.1189, 106.9156),
     "Pulau Seribu": (-5.7980, 106.5070)
 }
+WILAYAH_NAMES = tuple(wilayah_coords.keys())
+WILAYAH_DEFAULT = WILAYAH_NAMES[0]
+# Layout SoA: lat/lon per wilayah sebagai array, diindeks via WILAYAH_IDX
+WILAYAH_IDX = {name: i for i, name in enumerate(WILAYAH_NAMES)}
+WILAYAH_LATS = np.array([lat for lat, _ in wilayah_coords.values()])
+WILAYAH_LONS = np.array([lon for _, lon in wilayah_coords.values()])
+
+
+def get_wilayah_latlon(name):
+    """Mengembalikan (lat, lon) untuk nama wilayah."""
+    i = WILAYAH_IDX[name]
+    return float(WILAYAH_LATS[i]), float(WILAYAH_LONS[i])
+
+# =============================
+# Session HTTP (keep-alive & connection pooling)
+# =============================
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# =============================
+# Cache data (TTL) per koordinat
+# =============================
+CACHE_TTL = 1800
+_CACHE = {}
+
+
+def invalidate_cache():
+    """Mengosongkan cache data sehingga pengambilan berikutnya ke API."""
+    _CACHE.clear()
+
 
 # =============================
 # Fungsi ambil data Open-Meteo
 # =============================
-def get_air_quality_data(lat, lon):
+# Konsentrasi gas hanya 4-5 digit signifikan; float32 cukup dan menghemat
+# separuh memori untuk filter, rata-rata, dan plot.
+GAS_DTYPE = np.float32
+
+
+def get_air_quality_data(lat, lon, past_days=7, forecast_days=2):
     """Mengambil data kualitas udara (CO₂ & CH₄) dari API Open-Meteo.
 
+    Hasil disimpan di cache selama ``CACHE_TTL`` detik per kombinasi
+    koordinat dan rentang hari.
+
     Args:
         lat (float): Latitude.
         lon (float): Longitude.
+        past_days (int): Jumlah hari ke belakang.
+        forecast_days (int): Jumlah hari ke depan (termasuk hari ini).
 
     Returns:
         pd.DataFrame: Data waktu, CO₂ (ppm), CH₄ (ppb).
     """
+    key = (lat, lon, past_days, forecast_days)
+    cached = _CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+    df = _fetch_air_quality_data(lat, lon, past_days, forecast_days)
+    if not df.empty:
+        _CACHE[key] = (time.monotonic(), df)
+    return df
+
+
+def _empty_frame():
+    """DataFrame kosong dengan tipe kolom yang sama seperti data API."""
+    return pd.DataFrame({
+        "Waktu": pd.DatetimeIndex([], dtype="datetime64[ns]"),
+        "CO2_ppm": np.empty(0, dtype=GAS_DTYPE),
+        "CH4_ppb": np.empty(0, dtype=GAS_DTYPE),
+    })
+
+
+def _fetch_air_quality_data(lat, lon, past_days, forecast_days):
+    """Mengambil data langsung dari API Open-Meteo tanpa cache."""
     url = "https://air-quality-api.open-meteo.com/v1/air-quality"
     params = {
         "latitude": lat,
         "longitude": lon,
         "hourly": "carbon_dioxide,methane",
-        "past_days": 7,
-        "forecast_days": 2
+        "past_days": past_days,
+        "forecast_days": forecast_days
     }
     try:
-        resp = requests.get(url, params=params, timeout=10)
-        data = resp.json()
+        resp = SESSION.get(url, params=params, timeout=10)
+        data = orjson.loads(resp.content)
         if "hourly" not in data:
-            return pd.DataFrame({"Waktu": [], "CO2_ppm": [], "CH4_ppb": []})
-        times = pd.to_datetime(data["hourly"]["time"])
-        co2 = data["hourly"]["carbon_dioxide"]
-        ch4 = data["hourly"]["methane"]
+            return _empty_frame()
+        hourly = data["hourly"]
+        # Format waktu tetap "YYYY-MM-DDTHH:MM", langsung diparse oleh NumPy
+        times = pd.DatetimeIndex(
+            np.array(hourly["time"], dtype="datetime64[m]")
+            .astype("datetime64[ns]")
+        )
+        co2 = np.asarray(hourly["carbon_dioxide"], dtype=GAS_DTYPE)
+        ch4 = np.asarray(hourly["methane"], dtype=GAS_DTYPE)
         return pd.DataFrame({"Waktu": times, "CO2_ppm": co2, "CH4_ppb": ch4})
     except Exception:
-        return pd.DataFrame({"Waktu": [], "CO2_ppm": [], "CH4_ppb": []})
+        return _empty_frame()
+
+
+# =============================
+# Thread pekerja untuk pemanggilan API
+# =============================
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+def run_in_background(func, callback, *args, owner=None):
+    """Menjalankan func di thread pekerja, lalu callback(hasil) di thread Tk.
+
+    Args:
+        func (callable): Fungsi yang dijalankan di background.
+        callback (callable): Fungsi penerima hasil, dipanggil via root.after.
+        *args: Argumen untuk func.
+        owner (tk.Widget, optional): Widget pemilik hasil. Jika diisi, hanya
+            hasil permintaan terakhir untuk owner yang diteruskan; hasil
+            lama atau untuk widget yang sudah ditutup dibuang.
+    """
+    request_id = None
+    if owner is not None:
+        request_id = getattr(owner, "_request_id", 0) + 1
+        owner._request_id = request_id
+
+    def deliver(result):
+        if owner is not None and (not owner.winfo_exists()
+                                  or owner._request_id != request_id):
+            return
+        callback(result)
+
+    def dispatch(future):
+        try:
+            root.after(0, deliver, future.result())
+        except (RuntimeError, tk.TclError):
+            pass  # Aplikasi sudah ditutup
+
+    EXECUTOR.submit(func, *args).add_done_callback(dispatch)
 
 
 # =============================
@@ -67,6 +180,20 @@ root.title("Aplikasi Pemantauan Gas Rumah Kaca Jakarta")
 root.geometry("1200x850")
 root.configure(bg="#ECEFF1")
 
+# Style widget konten, dikonfigurasi sekali dan dipakai ulang di semua view
+style = ttk.Style(root)
+style.configure("H1.TLabel", font=("Segoe UI", 14, "bold"), background="#ECEFF1")
+style.configure("Body.TLabel", font=("Segoe UI", 12), background="#ECEFF1")
+style.configure("Status.TLabel", font=("Segoe UI", 12, "bold"),
+                background="#ECEFF1")
+style.configure("Small.TLabel", font=("Segoe UI", 10), background="#ECEFF1")
+
+# Tombol berwarna tetap tk.Button (tema ttk native mengabaikan background)
+PRIMARY_BUTTON = {"bg": "#1E88E5", "fg": "white",
+                  "font": ("Segoe UI", 12, "bold")}
+ACTION_BUTTON = {"bg": "#43A047", "fg": "white",
+                 "font": ("Segoe UI", 12, "bold")}
+
 header = tk.Label(
     root,
     text="Aplikasi Pemantauan Gas Rumah Kaca Jakarta: CO₂ & CH₄ Berbasis Open Data",
@@ -93,6 +220,7 @@ content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
 def on_close():
     """Handler untuk menutup aplikasi."""
     if messagebox.askokcancel("Keluar", "Apakah Anda yakin ingin menutup aplikasi?"):
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
         root.destroy()
 root.protocol("WM_DELETE_WINDOW", on_close)
 
@@ -100,15 +228,91 @@ root.protocol("WM_DELETE_WINDOW", on_close)
 # =============================
 # Bersihkan konten
 # =============================
+def destroy_children(parent, keep=None):
+    """Menghapus child langsung dari parent (Tk ikut menghapus turunannya).
+
+    Args:
+        parent (tk.Widget): Widget induk.
+        keep (tk.Widget, optional): Child yang tidak ikut dihapus.
+    """
+    for widget in parent.winfo_children():
+        if widget is not keep:
+            widget.destroy()
+
+
 def clear_content():
-    """Menghapus semua widget dari content_frame."""
-    for widget in content_frame.winfo_children():
-        widget.destroy()
+    """Menghapus semua widget dari content_frame.
+
+    Canvas grafik bersama tidak dihapus, hanya dilepas dari tampilan.
+    """
+    shared = APP_CANVAS.get_tk_widget() if APP_CANVAS is not None else None
+    _graph_state["owner"] = None
+    if shared is not None:
+        shared.pack_forget()
+    destroy_children(content_frame, keep=shared)
+
+
+# =============================
+# Penjadwalan (auto-refresh & debounce)
+# =============================
+def schedule_after(frame, attr, delay, func):
+    """Menjadwalkan func via root.after dan membatalkan jadwal sebelumnya.
+
+    Args:
+        frame (tk.Widget): Widget tempat menyimpan id jadwal.
+        attr (str): Nama atribut untuk id jadwal pada frame.
+        delay (int): Jeda dalam milidetik.
+        func (callable): Fungsi yang dijadwalkan.
+    """
+    job = getattr(frame, attr, None)
+    if job:
+        root.after_cancel(job)
+    setattr(frame, attr, root.after(delay, func))
 
 
 # =============================
 # Fungsi Plot Grafik
 # =============================
+def _import_matplotlib():
+    """Mengimpor matplotlib dan menerapkan style sekali saja."""
+    global plt, FigureCanvasTkAgg, mdates
+    if plt is not None:
+        return
+    import matplotlib.pyplot as pyplot
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_cls
+    import matplotlib.dates as dates
+
+    pyplot.style.use('ggplot')
+    plt, FigureCanvasTkAgg, mdates = pyplot, canvas_cls, dates
+
+
+# Figure & canvas bersama untuk semua view, dibuat saat pertama dipakai.
+APP_FIG = None
+APP_AX1 = None
+APP_AX2 = None
+APP_CANVAS = None
+_graph_state = {"owner": None, "lines": (), "bg": None}
+
+
+def _get_canvas():
+    """Membuat Figure dan canvas bersama (sekali saja) lalu mengembalikannya."""
+    global APP_FIG, APP_AX1, APP_AX2, APP_CANVAS
+    if APP_CANVAS is None:
+        _import_matplotlib()
+        APP_FIG, APP_AX1 = plt.subplots(figsize=(10, 4))
+        APP_AX2 = APP_AX1.twinx()
+        APP_CANVAS = FigureCanvasTkAgg(APP_FIG, master=content_frame)
+        APP_CANVAS.mpl_connect("draw_event", _on_draw)
+    return APP_CANVAS
+
+
+def _on_draw(event):
+    """Menyimpan background lalu menggambar garis setiap full redraw."""
+    _graph_state["bg"] = APP_CANVAS.copy_from_bbox(APP_FIG.bbox)
+    for line in _graph_state["lines"]:
+        line.axes.draw_artist(line)
+
+
 def plot_graph(df, graph_frame, title="CO₂ & CH₄"):
     """Menampilkan grafik CO₂ & CH₄ pada frame Tkinter.
 
@@ -116,23 +320,60 @@ def plot_graph(df, graph_frame, title="CO₂ & CH₄"):
         df (pd.DataFrame): Data kualitas udara.
         graph_frame (tk.Frame): Frame target untuk grafik.
         title (str): Judul grafik.
+
+    Semua view memakai satu Figure dan canvas bersama. Saat graph_frame
+    berganti, sumbu dibersihkan dan digambar ulang; untuk graph_frame yang
+    sama hanya data garis yang diperbarui. Jika batas sumbu tidak berubah,
+    garis di-blit di atas background yang di-cache.
     """
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
+    canvas = _get_canvas()
+    widget = canvas.get_tk_widget()
     if df.empty:
-        tk.Label(graph_frame, text="Tidak ada data tersedia.",
-                 font=("Segoe UI", 12), bg="#ECEFF1").pack()
+        destroy_children(graph_frame)
+        if _graph_state["owner"] is graph_frame:
+            widget.pack_forget()
+            _graph_state["owner"] = None
+        ttk.Label(graph_frame, text="Tidak ada data tersedia.",
+                  style="Body.TLabel").pack()
+        return
+
+    axes = (APP_AX1, APP_AX2)
+    if _graph_state["owner"] is graph_frame:
+        line_co2, line_ch4 = _graph_state["lines"]
+        old_limits = [(ax.get_xlim(), ax.get_ylim()) for ax in axes]
+        line_co2.set_data(df["Waktu"], df["CO2_ppm"])
+        line_ch4.set_data(df["Waktu"], df["CH4_ppb"])
+        for ax in axes:
+            ax.relim()
+            ax.autoscale_view()
+        new_limits = [(ax.get_xlim(), ax.get_ylim()) for ax in axes]
+        if new_limits != old_limits or _graph_state["bg"] is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(_graph_state["bg"])
+        APP_AX1.draw_artist(line_co2)
+        APP_AX2.draw_artist(line_ch4)
+        canvas.blit(APP_FIG.bbox)
         return
 
-    fig, ax1 = plt.subplots(figsize=(10, 4))
-    ax1.plot(df["Waktu"], df["CO2_ppm"],
-             color="#1E88E5", marker="o", label="CO₂ (ppm)")
+    destroy_children(graph_frame)
+
+    ax1, ax2 = axes
+    ax1.cla()
+    ax2.cla()
+    # cla() mengembalikan pengaturan twinx ke default, jadi diterapkan ulang
+    ax2.yaxis.tick_right()
+    ax2.yaxis.set_label_position("right")
+    ax2.xaxis.set_visible(False)
+    ax2.patch.set_visible(False)
+
+    line_co2, = ax1.plot(df["Waktu"], df["CO2_ppm"], animated=True,
+                         color="#1E88E5", marker="o", label="CO₂ (ppm)")
     ax1.set_xlabel("Waktu")
     ax1.set_ylabel("CO₂ (ppm)", color="#1E88E5")
 
-    ax2 = ax1.twinx()
-    ax2.plot(df["Waktu"], df["CH4_ppb"],
-             color="#FB8C00", marker="s", label="CH₄ (ppb)")
+    line_ch4, = ax2.plot(df["Waktu"], df["CH4_ppb"], animated=True,
+                         color="#FB8C00", marker="s", label="CH₄ (ppb)")
     ax2.set_ylabel("CH₄ (ppb)", color="#FB8C00")
 
     ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
@@ -142,58 +383,49 @@ def plot_graph(df, graph_frame, title="CO₂ & CH₄"):
     ax2.tick_params(axis="y", labelsize=10)
     ax1.set_title(title)
 
-    fig.tight_layout()
-    canvas = FigureCanvasTkAgg(fig, master=graph_frame)
+    APP_FIG.tight_layout()
+    _graph_state.update(owner=graph_frame, lines=(line_co2, line_ch4), bg=None)
+    widget.pack(in_=graph_frame, fill="both", expand=True)
+    widget.lift(graph_frame)
     canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True)
 
 
 # =============================
 # Fungsi KPI
 # =============================
+# Ambang batas status; batas atas "Waspada" bersifat inklusif (<= 500 ppm,
+# <= 2000 ppb), sehingga nilai kedua digeser ke float berikutnya.
+CO2_THRESHOLDS = np.array([450.0, np.nextafter(500.0, np.inf)])
+CH4_THRESHOLDS = np.array([1950.0, np.nextafter(2000.0, np.inf)])
+STATUS = ("Normal", "Waspada", "Tinggi")
+
+
 def show_kpi(df, kpi_frame):
     """Menampilkan indikator KPI berdasarkan rata-rata CO₂ & CH₄."""
-    for widget in kpi_frame.winfo_children():
-        widget.destroy()
+    destroy_children(kpi_frame)
     if df.empty:
-        tk.Label(kpi_frame, text="Tidak ada data KPI.",
-                 font=("Segoe UI", 12), bg="#ECEFF1").pack()
+        ttk.Label(kpi_frame, text="Tidak ada data KPI.",
+                  style="Body.TLabel").pack()
         return
 
-    co2_avg = df["CO2_ppm"].mean()
-    ch4_avg = df["CH4_ppb"].mean()
-
-    # Status CO2
-    if co2_avg < 450:
-        status_co2 = "Normal"
-    elif 450 <= co2_avg <= 500:
-        status_co2 = "Waspada"
-    else:
-        status_co2 = "Tinggi"
-
-    # Status CH4
-    if ch4_avg < 1950:
-        status_ch4 = "Normal"
-    elif 1950 <= ch4_avg <= 2000:
-        status_ch4 = "Waspada"
-    else:
-        status_ch4 = "Tinggi"
-
-    status_levels = {"Normal": 1, "Waspada": 2, "Tinggi": 3}
-    overall_status = max([status_co2, status_ch4],
-                         key=lambda x: status_levels[x])
+    # Open-Meteo mengembalikan null untuk jam yang kosong (NaN)
+    co2_avg = float(np.nanmean(df["CO2_ppm"].to_numpy()))
+    ch4_avg = float(np.nanmean(df["CH4_ppb"].to_numpy()))
+
+    level_co2 = int(np.searchsorted(CO2_THRESHOLDS, co2_avg, side="right"))
+    level_ch4 = int(np.searchsorted(CH4_THRESHOLDS, ch4_avg, side="right"))
+    overall_status = STATUS[max(level_co2, level_ch4)]
     status_colors = {"Normal": "#43A047",
                      "Waspada": "#FFA726",
                      "Tinggi": "#E53935"}
     status_color = status_colors[overall_status]
 
-    tk.Label(
+    ttk.Label(
         kpi_frame,
         text=f"CO₂ Avg: {co2_avg:.1f} ppm | CH₄ Avg: {ch4_avg:.1f} ppb | "
              f"Status: {overall_status}",
-        font=("Segoe UI", 12, "bold"),
-        bg="#ECEFF1",
-        fg=status_color
+        style="Status.TLabel",
+        foreground=status_color
     ).pack()
 
 
@@ -202,9 +434,9 @@ def show_kpi(df, kpi_frame):
 # =============================
 def add_save_button(parent_frame, df, label="Simpan CSV"):
     """Menambahkan tombol untuk menyimpan DataFrame ke CSV."""
-    for widget in parent_frame.pack_slaves():
-        if getattr(widget, "is_save_button", False):
-            widget.destroy()
+    old_btn = getattr(parent_frame, "_save_btn", None)
+    if old_btn is not None:
+        old_btn.destroy()
 
     def save_csv():
         file_path = filedialog.asksaveasfilename(
@@ -212,19 +444,23 @@ def add_save_button(parent_frame, df, label="Simpan CSV"):
             filetypes=[("CSV files", "*.csv")],
             title=label
         )
-        if file_path:
-            df.to_csv(file_path, index=False)
-
-    btn = tk.Button(
-        parent_frame,
-        text=label,
-        bg="#1E88E5",
-        fg="white",
-        font=("Segoe UI", 12, "bold"),
-        command=save_csv
-    )
-    btn.is_save_button = True
+        if not file_path:
+            return
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        # Waktu ditulis sebagai teks agar tidak muncul presisi nanodetik
+        out = df.assign(Waktu=df["Waktu"].dt.strftime("%Y-%m-%d %H:%M:%S"))
+        table = pa.Table.from_pandas(out, preserve_index=False)
+        options = pacsv.WriteOptions(include_header=False, quoting_style="none")
+        with open(file_path, "wb") as f:
+            f.write((",".join(table.column_names) + "\n").encode())
+            pacsv.write_csv(table, f, options)
+
+    btn = tk.Button(parent_frame, text=label, command=save_csv,
+                    **PRIMARY_BUTTON)
     btn.pack(pady=10)
+    parent_frame._save_btn = btn
 
 
 # =============================
@@ -233,22 +469,27 @@ def add_save_button(parent_frame, df, label="Simpan CSV"):
 def show_realtime():
     """Menampilkan dashboard realtime (data hari ini)."""
     clear_content()
-    tk.Label(content_frame, text="Dashboard Realtime (Hari ini)",
-             font=("Segoe UI", 14, "bold"), bg="#ECEFF1").pack(pady=10)
+    ttk.Label(content_frame, text="Dashboard Realtime (Hari ini)",
+              style="H1.TLabel").pack(pady=10)
 
     wilayah_var = tk.StringVar()
-    wilayah_var.set(list(wilayah_coords.keys())[0])
+    wilayah_var.set(WILAYAH_DEFAULT)
 
-    tk.Label(content_frame, text="Pilih Wilayah:",
-             font=("Segoe UI", 12), bg="#ECEFF1").pack(pady=5)
+    ttk.Label(content_frame, text="Pilih Wilayah:",
+              style="Body.TLabel").pack(pady=5)
     combobox = ttk.Combobox(
         content_frame,
         textvariable=wilayah_var,
-        values=list(wilayah_coords.keys()),
+        values=WILAYAH_NAMES,
         state="readonly"
     )
     combobox.pack(pady=5)
 
+    tk.Button(content_frame,
+              text="Refresh",
+              command=lambda: (invalidate_cache(), update_graph()),
+              **PRIMARY_BUTTON).pack(pady=5)
+
     graph_frame = tk.Frame(content_frame, bg="#ECEFF1")
     graph_frame.pack(pady=10, fill="both", expand=True)
 
@@ -257,18 +498,30 @@ def show_realtime():
 
     refresh_interval = 600000
 
-    def update_graph():
-        """Mengupdate grafik realtime."""
-        lat, lon = wilayah_coords[wilayah_var.get()]
-        df = get_air_quality_data(lat, lon)
-        today = datetime.now().date()
-        df_today = df[df["Waktu"].dt.date == today]
+    def apply_graph(df):
+        """Menampilkan data hari ini pada grafik, KPI, dan tombol simpan."""
+        start = pd.Timestamp(datetime.now().date())
+        end = start + pd.Timedelta(days=1)
+        df_today = df[(df["Waktu"] >= start) & (df["Waktu"] < end)]
         plot_graph(df_today, graph_frame, title="CO₂ & CH₄ Hari Ini")
         show_kpi(df_today, kpi_frame)
         add_save_button(content_frame, df_today, label="Simpan CSV Realtime")
-        root.after(refresh_interval, update_graph)
 
-    combobox.bind("<<ComboboxSelected>>", lambda e: update_graph())
+    def update_graph():
+        """Mengupdate grafik realtime."""
+        if not graph_frame.winfo_exists():
+            return
+        lat, lon = get_wilayah_latlon(wilayah_var.get())
+        # Batas hari API dalam GMT; pukul 00:00-06:59 WIB "hari ini" lokal
+        # baru tercakup oleh hari forecast kedua.
+        run_in_background(get_air_quality_data, apply_graph, lat, lon, 0, 2,
+                          owner=graph_frame)
+        schedule_after(graph_frame, "_after_id", refresh_interval, update_graph)
+
+    combobox.bind(
+        "<<ComboboxSelected>>",
+        lambda e: schedule_after(graph_frame, "_debounce_id", 150, update_graph)
+    )
     update_graph()
 # =============================
 # Proyeksi Beberapa Jam Kedepan
@@ -276,39 +529,52 @@ def show_realtime():
 def show_forecast():
     """Menampilkan proyeksi beberapa jam ke depan untuk CO₂ & CH₄."""
     clear_content()
-    tk.Label(content_frame,
-             text="Proyeksi Beberapa Jam Kedepan CO₂ & CH₄",
-             font=("Segoe UI", 14, "bold"), bg="#ECEFF1").pack(pady=10)
+    ttk.Label(content_frame, text="Proyeksi Beberapa Jam Kedepan CO₂ & CH₄",
+              style="H1.TLabel").pack(pady=10)
 
     wilayah_var = tk.StringVar()
-    wilayah_var.set(list(wilayah_coords.keys())[0])
+    wilayah_var.set(WILAYAH_DEFAULT)
 
-    tk.Label(content_frame, text="Pilih Wilayah:",
-             font=("Segoe UI", 12), bg="#ECEFF1").pack(pady=5)
+    ttk.Label(content_frame, text="Pilih Wilayah:",
+              style="Body.TLabel").pack(pady=5)
     combobox = ttk.Combobox(
         content_frame,
         textvariable=wilayah_var,
-        values=list(wilayah_coords.keys()),
+        values=WILAYAH_NAMES,
         state="readonly"
     )
     combobox.pack(pady=5)
 
+    tk.Button(content_frame,
+              text="Refresh",
+              command=lambda: (invalidate_cache(), update_forecast()),
+              **PRIMARY_BUTTON).pack(pady=5)
+
     graph_frame = tk.Frame(content_frame, bg="#ECEFF1")
     graph_frame.pack(pady=10, fill="both", expand=True)
 
     refresh_interval = 600000
 
-    def update_forecast():
-        """Mengupdate grafik proyeksi (forecast)."""
-        lat, lon = wilayah_coords[wilayah_var.get()]
-        df = get_air_quality_data(lat, lon)
-        now = datetime.now()
-        df_forecast = df[df["Waktu"] > now]
+    def apply_forecast(df):
+        """Menampilkan data proyeksi pada grafik dan tombol simpan."""
+        now = np.datetime64(datetime.now())
+        df_forecast = df[df["Waktu"].values > now]
         plot_graph(df_forecast, graph_frame, title="Forecast CO₂ & CH₄")
         add_save_button(content_frame, df_forecast, label="Simpan CSV Forecast")
-        root.after(refresh_interval, update_forecast)
 
-    combobox.bind("<<ComboboxSelected>>", lambda e: update_forecast())
+    def update_forecast():
+        """Mengupdate grafik proyeksi (forecast)."""
+        if not graph_frame.winfo_exists():
+            return
+        lat, lon = get_wilayah_latlon(wilayah_var.get())
+        run_in_background(get_air_quality_data, apply_forecast,
+                          lat, lon, 0, 2, owner=graph_frame)
+        schedule_after(graph_frame, "_after_id", refresh_interval, update_forecast)
+
+    combobox.bind(
+        "<<ComboboxSelected>>",
+        lambda e: schedule_after(graph_frame, "_debounce_id", 150, update_forecast)
+    )
     update_forecast()
 
 
@@ -317,19 +583,20 @@ def show_forecast():
 # =============================
 def show_data_periode():
     """Menampilkan data berdasarkan periode tanggal yang dipilih pengguna."""
+    from tkcalendar import DateEntry
+
     clear_content()
-    tk.Label(content_frame, text="Data Periode CO₂ & CH₄",
-             font=("Segoe UI", 14, "bold"), bg="#ECEFF1").pack(pady=10)
+    ttk.Label(content_frame, text="Data Periode CO₂ & CH₄",
+              style="H1.TLabel").pack(pady=10)
 
     wilayah_var = tk.StringVar()
-    wilayah_var.set(list(wilayah_coords.keys())[0])
+    wilayah_var.set(WILAYAH_DEFAULT)
 
-    tk.Label(content_frame, text="Pilih Wilayah:",
-             font=("Segoe UI", 12), bg="#ECEFF1").pack()
+    ttk.Label(content_frame, text="Pilih Wilayah:", style="Body.TLabel").pack()
     combobox = ttk.Combobox(
         content_frame,
         textvariable=wilayah_var,
-        values=list(wilayah_coords.keys()),
+        values=WILAYAH_NAMES,
         state="readonly"
     )
     combobox.pack(pady=5)
@@ -338,8 +605,7 @@ def show_data_periode():
     today = datetime.today().date()
     min_date = today - timedelta(days=max_days)
 
-    tk.Label(content_frame, text="Tanggal Mulai:",
-             font=("Segoe UI", 12), bg="#ECEFF1").pack()
+    ttk.Label(content_frame, text="Tanggal Mulai:", style="Body.TLabel").pack()
     start_cal = DateEntry(
         content_frame,
         width=12,
@@ -352,8 +618,7 @@ def show_data_periode():
     )
     start_cal.pack(pady=5)
 
-    tk.Label(content_frame, text="Tanggal Akhir:",
-             font=("Segoe UI", 12), bg="#ECEFF1").pack()
+    ttk.Label(content_frame, text="Tanggal Akhir:", style="Body.TLabel").pack()
     end_cal = DateEntry(
         content_frame,
         width=12,
@@ -380,28 +645,36 @@ def show_data_periode():
     tree.heading("CH4_ppb", text="CH₄ (ppb)")
     tree.pack(fill="both", expand=True)
 
+    def apply_data(df, start_date, end_date):
+        """Menampilkan data pada tabel berdasarkan periode."""
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        df_period = df[df["Waktu"].between(start, end, inclusive="left")]
+        tree.delete(*tree.get_children())
+        if not df_period.empty:
+            waktu = df_period["Waktu"].dt.strftime("%Y-%m-%d %H:%M").to_numpy()
+            co2 = df_period["CO2_ppm"].to_numpy()
+            ch4 = df_period["CH4_ppb"].to_numpy()
+            for w, c, m in zip(waktu, co2, ch4):
+                tree.insert("", "end", values=(w, c, m))
+        add_save_button(content_frame, df_period, label="Simpan CSV Periode")
+
     def ambil_data():
         """Mengambil data dari API dan menampilkan pada tabel berdasarkan periode."""
-        lat, lon = wilayah_coords[wilayah_var.get()]
+        lat, lon = get_wilayah_latlon(wilayah_var.get())
         start_date = start_cal.get_date()
         end_date = end_cal.get_date()
-        df = get_air_quality_data(lat, lon)
-        df_period = df[(df["Waktu"].dt.date >= start_date) &
-                       (df["Waktu"].dt.date <= end_date)]
-        for i in tree.get_children():
-            tree.delete(i)
-        for _, row in df_period.iterrows():
-            waktu_str = row["Waktu"].strftime("%Y-%m-%d %H:%M")
-            tree.insert("", "end",
-                        values=(waktu_str, row["CO2_ppm"], row["CH4_ppb"]))
-        add_save_button(content_frame, df_period, label="Simpan CSV Periode")
+        run_in_background(
+            get_air_quality_data,
+            lambda df: apply_data(df, start_date, end_date),
+            lat, lon,
+            owner=tree
+        )
 
     tk.Button(content_frame,
               text="Ambil Data",
-              bg="#43A047",
-              fg="white",
-              font=("Segoe UI", 12, "bold"),
-              command=ambil_data).pack(pady=10)
+              command=ambil_data,
+              **ACTION_BUTTON).pack(pady=10)
 
 
 # =============================
@@ -443,9 +716,8 @@ def show_about():
         "5. Hak cipta atas data dan API tetap dimiliki oleh Open-Meteo. \n"
         "   Pengguna harus mematuhi ketentuan penggunaan Open-Meteo. \n"
     )
-    tk.Label(content_frame, text=text, justify="left",
-             font=("Segoe UI", 10), wraplength=800, bg="#ECEFF1").pack(pady=40,
-                                                                      padx=40)
+    ttk.Label(content_frame, text=text, justify="left", wraplength=800,
+              style="Small.TLabel").pack(pady=40, padx=40)
 
 
 # =============================